@@ -25,6 +25,12 @@ class Settings(BaseSettings):
     SURREALDB_NS: str = Field(default="endash")
     SURREALDB_DB: str = Field(default="homelab")
     USE_SURREALDB: bool = Field(default=True)
+    SURREALDB_AUTH_MODE: str = Field(default="root")  # root, namespace or database level signin
+    SURREALDB_POOL_SIZE: int = Field(default=8)  # Max pooled connections for reads/writes (live queries use their own)
+    SURREALDB_POOL_MIN_SIZE: int = Field(default=2)  # Pooled connections opened at startup; the rest open on demand
+    SURREALDB_POOL_TIMEOUT: float = Field(default=10.0)  # Seconds to wait for a free pooled connection
+    SURREALDB_LIVE_QUEUE_SIZE: int = Field(default=256)  # Pending notifications buffered per live query
+    SURREALDB_LIVE_QUEUE_DROP: str = Field(default="oldest")  # oldest or newest - which update to drop when full
 
     # Application Settings
     PROJECT_NAME: str = "En-Dash"
@@ -68,6 +74,22 @@ class Settings(BaseSettings):
             raise ValueError(f"Environment must be one of: {allowed}")
         return v
     
+    @field_validator("SURREALDB_AUTH_MODE")
+    @classmethod
+    def validate_surrealdb_auth_mode(cls, v: str) -> str:
+        allowed = ["root", "namespace", "database"]
+        if v.lower() not in allowed:
+            raise ValueError(f"SurrealDB auth mode must be one of: {allowed}")
+        return v.lower()
+
+    @field_validator("SURREALDB_LIVE_QUEUE_DROP")
+    @classmethod
+    def validate_surrealdb_live_queue_drop(cls, v: str) -> str:
+        allowed = ["oldest", "newest"]
+        if v.lower() not in allowed:
+            raise ValueError(f"SurrealDB live queue drop policy must be one of: {allowed}")
+        return v.lower()
+    
     @field_validator("LOG_LEVEL")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
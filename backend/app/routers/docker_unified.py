@@ -12,9 +12,10 @@ import subprocess
 from typing import Dict, Any
 from datetime import datetime, timezone
 from pathlib import Path
+import orjson
 import yaml
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Response
 import docker
 
 from ..services.docker_unified import unified_stack_service
@@ -136,20 +137,24 @@ async def get_unified_stacks():
     try:
         logger.info("REST: Getting unified stacks data...")
         
-        # Try SurrealDB first for speed
-        stacks_from_db = await surreal_service.get_unified_stacks()
+        # Try SurrealDB first for speed - pre-encoded, so the (possibly large)
+        # stack list is spliced into the response instead of re-encoded
+        stacks_json, total_stacks = await surreal_service.get_unified_stacks_json()
         
-        if stacks_from_db:
-            return {
-                "success": True,
-                "data": {
-                    "available": True,
-                    "stacks": stacks_from_db,
-                    "total_stacks": len(stacks_from_db),
-                    "source": "surrealdb"
-                },
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }
+        if stacks_json:
+            return Response(
+                content=orjson.dumps({
+                    "success": True,
+                    "data": {
+                        "available": True,
+                        "stacks": orjson.Fragment(stacks_json),
+                        "total_stacks": total_stacks,
+                        "source": "surrealdb"
+                    },
+                    "timestamp": datetime.now(timezone.utc).isoformat()
+                }),
+                media_type="application/json"
+            )
         else:
             # Fallback to comprehensive discovery
             unified_stacks = await unified_stack_service.get_all_unified_stacks()
@@ -272,8 +277,9 @@ async def get_docker_library():
         # Try to get from SurrealDB first
         try:
             if surreal_service.connected:
-                # Use the direct db.query method from the SurrealDB client
-                result = await surreal_service.db.query("SELECT * FROM docker_services ORDER BY popularity_score DESC")
+                # Use a pooled connection so the live-query socket isn't contended
+                async with surreal_service.acquire() as db:
+                    result = await db.query("SELECT * FROM docker_services ORDER BY popularity_score DESC")
                 
                 if result and len(result) > 0:
                     # SurrealDB actually returns a flat array: [service1, service2, service3, ...]
@@ -416,8 +422,9 @@ async def create_docker_library_service(service_data: Dict[str, Any]):
         service_data["updated_at"] = datetime.now(timezone.utc).isoformat()
         service_data["popularity_score"] = service_data.get("popularity_score", 0)
         
-        # Insert into database using the direct db.create method
-        result = await surreal_service.db.create("docker_services", service_data)
+        # Insert into database using a pooled connection
+        async with surreal_service.acquire() as db:
+            result = await db.create("docker_services", service_data)
         
         return {
             "success": True,
@@ -445,11 +452,12 @@ async def get_docker_library_service(service_id: str):
                 detail="Database connection not available"
             )
         
-        # Use the direct db.query method with parameters
-        result = await surreal_service.db.query(
-            "SELECT * FROM docker_services WHERE id = $service_id",
-            {"service_id": service_id}
-        )
+        # Query with parameters on a pooled connection
+        async with surreal_service.acquire() as db:
+            result = await db.query(
+                "SELECT * FROM docker_services WHERE id = $service_id",
+                {"service_id": service_id}
+            )
         
         if not result or len(result) == 0 or len(result[0]) == 0:
             raise HTTPException(
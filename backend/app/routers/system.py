@@ -105,23 +105,6 @@ async def get_current_stats():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving system stats: {str(e)}")
 
-@router.get("/stats/history")
-async def get_historical_stats(hours_back: int = Query(24, ge=1, le=168)):
-    """Get historical system statistics from SurrealDB"""
-    try:
-        stats = await surreal_service.get_system_stats(hours_back=hours_back)
-        
-        return {
-            "success": True,
-            "hours_back": hours_back,
-            "total_records": len(stats),
-            "data": stats,
-            "note": "Real-time stats available via WebSocket at /api/docker/ws/unified"
-        }
-    except Exception as e:
-        logger.error(f"Error retrieving historical stats: {e}")
-        raise HTTPException(status_code=500, detail=f"Error retrieving historical stats: {str(e)}")
-
 @router.get("/processes")
 async def get_processes(limit: int = Query(50, ge=1, le=500)):
     """Get list of running processes"""
@@ -357,6 +340,12 @@ class StatField(str, Enum):
     NETWORK_PACKETS_RECV = "network_packets_recv"
     ALL = "all"
 
+def _projected_columns(fields: List[StatField]) -> Optional[List[str]]:
+    """Columns to SELECT for the requested fields (None means every column)"""
+    if StatField.ALL in fields:
+        return None
+    return [field.value for field in fields]
+
 @router.get("/stats/range")
 async def get_stats_range(
     minutes_back: int = Query(60, ge=1, le=1440, description="Minutes of history (1-1440)"),
@@ -368,8 +357,10 @@ async def get_stats_range(
     PHASE 3: Works with time-series complex record IDs
     """
     try:
-        # Use the new time-series method
-        stats = await surreal_service.get_system_stats_range_timeseries(minutes_back=minutes_back)
+        # Use the new time-series method, selecting only the requested columns
+        stats = await surreal_service.get_system_stats_range_timeseries(
+            minutes_back=minutes_back, fields=_projected_columns(fields), limit=limit
+        )
         
         if not stats:
             return {
@@ -382,7 +373,7 @@ async def get_stats_range(
         
         # Apply field filtering
         filtered_stats = []
-        for stat in stats[:limit]:  # Apply limit
+        for stat in stats:  # Already limited by the query
             if StatField.ALL in fields:
                 # Return all fields
                 filtered_stats.append(stat)
@@ -414,7 +405,7 @@ async def get_latest_stats(
     print("🔍 DEBUG: /stats/latest endpoint called!")
     try:
         print("🔍 DEBUG: About to call get_system_stats_latest_timeseries()")
-        latest_stat = await surreal_service.get_system_stats_latest_timeseries()
+        latest_stat = await surreal_service.get_system_stats_latest_timeseries(fields=_projected_columns(fields))
         print(f"🔍 DEBUG: Method returned: {latest_stat}")
         
         if not latest_stat:
@@ -454,8 +445,11 @@ async def get_stats_summary(
     PHASE 3: Perfect for dashboard cards and alerts
     """
     try:
-        # Get raw data using time-series method
-        stats = await surreal_service.get_system_stats_range_timeseries(minutes_back=minutes_back)
+        # Get raw data using time-series method - only the columns being summarised
+        summary_columns = [field.value for field in fields if field != StatField.ALL]
+        stats = await surreal_service.get_system_stats_range_timeseries(
+            minutes_back=minutes_back, fields=summary_columns or None
+        )
         
         if not stats:
             return {"success": True, "data": {}, "note": "No data available for summary"}
@@ -509,7 +503,9 @@ async def get_historical_stats(
         minutes_back = hours_back * 60
         
         # Use new time-series method instead of old get_system_stats
-        stats = await surreal_service.get_system_stats_range_timeseries(minutes_back=minutes_back)
+        stats = await surreal_service.get_system_stats_range_timeseries(
+            minutes_back=minutes_back, fields=_projected_columns(fields), limit=limit
+        )
         
         if not stats:
             return {
@@ -520,9 +516,9 @@ async def get_historical_stats(
                 "note": "No historical data available"
             }
         
-        # Apply field filtering and limit
+        # Apply field filtering (limit is applied by the query)
         filtered_stats = []
-        for stat in stats[:limit]:
+        for stat in stats:
             if StatField.ALL in fields:
                 filtered_stats.append(stat)
             else:
@@ -82,7 +82,7 @@ class BackgroundCollector:
                     self.docker_check_count += 1
                     
                     # Collect current Docker state
-                    logger.debug(f"🔍 Docker collection check #{self.docker_check_count}")
+                    logger.debug("🔍 Docker collection check #%d", self.docker_check_count)
                     stacks = await unified_stack_service.get_all_unified_stacks()
 
                     # =============================================================================
@@ -108,7 +108,7 @@ class BackgroundCollector:
                         if running_stacks:
                             logger.info(f"   📦 Running stacks: {', '.join(running_stacks)}")
                     else:
-                        logger.debug(f"✅ Docker state unchanged - skipped database write")
+                        logger.debug("✅ Docker state unchanged - skipped database write")
                     
                     # Wait 30 seconds before next check (with early exit on shutdown)
                     for _ in range(60):
@@ -279,7 +279,9 @@ class BackgroundCollector:
             # Broadcast MINIMAL payload for real-time updates
             await data_broadcaster._broadcast_system_stats(minimal_stats, trigger="minimal")
             
-            logger.debug(f"📊 Minimal stats broadcast: {len(str(minimal_stats))} bytes vs {len(str(stats_data))} bytes")
+            # Sizing both payloads means stringifying them, so only do it when it gets logged
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📊 Minimal stats broadcast: %d bytes vs %d bytes", len(str(minimal_stats)), len(str(stats_data)))
             
         except Exception as e:
             logger.error(f"Error in minimal stats broadcast: {e}")
@@ -64,14 +64,21 @@ class DataBroadcaster:
         """Stop data broadcasting services"""
         self.running = False
         
-        # Stop all live queries
-        for query_type, live_id in self.live_query_ids.items():
-            try:
-                if surreal_service.connected:
-                    await surreal_service.kill_live_query(live_id)
+        # Stop all live queries - kills are independent, so issue them together
+        query_types = list(self.live_query_ids.keys())
+        if surreal_service.connected and query_types:
+            results = await asyncio.gather(
+                *(surreal_service.kill_live_query(self.live_query_ids[query_type]) for query_type in query_types),
+                return_exceptions=True
+            )
+        else:
+            results = [None] * len(query_types)
+        
+        for query_type, result in zip(query_types, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error stopping live query {query_type}: {result}")
+            else:
                 logger.info(f"🛑 Stopped live query for {query_type}")
-            except Exception as e:
-                logger.error(f"Error stopping live query {query_type}: {e}")
         
         # Cancel all tasks
         all_tasks = list(self.live_query_tasks.values()) + list(self.polling_tasks.values())
@@ -292,7 +299,8 @@ class DataBroadcaster:
                 # Try live query first
                 live_id = await surreal_service.create_live_query(
                     "user_events",
-                    self._handle_user_event
+                    self._handle_user_events,
+                    batch=True
                 )
                                 
                 if live_id:
@@ -321,12 +329,13 @@ class DataBroadcaster:
         except Exception as e:
             print(f"🐛 ERROR in docker update: {e}")
 
-    async def _handle_user_event(self, event_data: Any):
-        """Handle user events from the events table"""
+    async def _handle_user_events(self, events: List[Any]):
+        """Handle a burst of user events from the events table"""
         try:
             
-            # Only broadcast for Docker-related events
-            if "docker" in str(event_data).lower():
+            # Only broadcast for Docker-related events - once per burst, since
+            # every broadcast re-reads the full stack list anyway
+            if any("docker" in str(event_data).lower() for event_data in events):
                 
                 # Get fresh stack data and broadcast
                 stacks = await unified_stack_service.get_all_unified_stacks()
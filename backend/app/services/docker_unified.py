@@ -859,12 +859,15 @@ class UnifiedStackService:
         """Build unified service information with container details"""
         services = {}
         
+        # Group containers by compose service in a single pass instead of
+        # rescanning every container for each service
+        containers_by_service: Dict[str, List] = {}
+        for c in containers:
+            containers_by_service.setdefault(c.get("compose", {}).get("service"), []).append(c)
+        
         for service_name, service_config in compose_services.items():
             # Find containers for this service
-            service_containers = [
-                c for c in containers 
-                if c.get("compose", {}).get("service") == service_name
-            ]
+            service_containers = containers_by_service.get(service_name, [])
             
             # Build service object
             services[service_name] = {
@@ -884,7 +887,7 @@ class UnifiedStackService:
                 # Container information
                 "containers": service_containers,
                 "container_count": len(service_containers),
-                "running_containers": len([c for c in service_containers if c["status"] == "running"]),
+                "running_containers": sum(1 for c in service_containers if c["status"] == "running"),
                 
                 # Service status based on containers
                 "status": self._calculate_service_status(service_containers),
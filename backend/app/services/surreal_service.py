@@ -6,11 +6,18 @@ Based on official SurrealDB Python SDK documentation for v2.0.0 to v2.3.6
 
 import asyncio
 import hashlib
-import json
+import inspect
 import logging
-from datetime import datetime, timezone, timedelta
-from typing import Any, Callable, Dict, List, Optional
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
+import orjson
 from surrealdb import AsyncSurreal
 from surrealdb.data import RecordID, Table
 
@@ -18,22 +25,445 @@ from ..core.config import settings
 
 logger = logging.getLogger(__name__)
 
-def serialize_surrealdb_objects(obj: Any) -> Any:
-    """Recursively convert SurrealDB objects to JSON-serializable types"""
-    if isinstance(obj, RecordID):
-        return str(obj)
-    elif isinstance(obj, Table):
+# Stack lists at or above this size are hashed in a worker thread so the
+# serialize+hash step doesn't stall live-query listeners and request handlers
+_HASH_OFFLOAD_THRESHOLD = 25
+
+_STACKS_TABLE = "unified_stack"
+
+# unified_stack records are keyed by stack name, so a changed stack can be
+# upserted in place and a removed one deleted without reading the table first
+_REPLACE_STACKS_QUERY = """
+BEGIN TRANSACTION;
+DELETE unified_stack;
+FOR $stack IN $stacks { CREATE type::thing("unified_stack", $stack.name) CONTENT $stack; };
+COMMIT TRANSACTION;
+"""
+
+# Bootstrapped once per connect; backs the DELETE ... WHERE name IN $removed
+# of incremental stack syncs
+_SCHEMA_QUERY = "DEFINE INDEX IF NOT EXISTS unified_stack_name ON unified_stack FIELDS name UNIQUE;"
+
+# Above this fraction of changed + removed stacks a sync replaces the whole
+# table instead of applying per-stack upserts and deletes
+_STACK_CHURN_REPLACE_RATIO = 0.5
+
+_APPLY_STACK_CHANGES_QUERY = """
+BEGIN TRANSACTION;
+FOR $stack IN $changed { UPSERT type::thing("unified_stack", $stack.name) CONTENT $stack; };
+DELETE unified_stack WHERE name IN $removed;
+COMMIT TRANSACTION;
+"""
+
+# Upper bound for the backoff between live-query connection restore attempts (seconds)
+_LIVE_RESTORE_MAX_DELAY = 30.0
+
+# Signin payload per SURREALDB_AUTH_MODE, so each connection authenticates
+# with exactly one round trip instead of probing payload shapes
+_AUTH_PAYLOADS: Dict[str, Callable[[], Dict[str, str]]] = {
+    "root": lambda: {
+        "username": settings.SURREALDB_USER,
+        "password": settings.SURREALDB_PASS,
+    },
+    "namespace": lambda: {
+        "namespace": settings.SURREALDB_NS,
+        "username": settings.SURREALDB_USER,
+        "password": settings.SURREALDB_PASS,
+    },
+    "database": lambda: {
+        "namespace": settings.SURREALDB_NS,
+        "database": settings.SURREALDB_DB,
+        "username": settings.SURREALDB_USER,
+        "password": settings.SURREALDB_PASS,
+    },
+}
+
+# Dashboard summaries are polled by several clients at once; reuse one
+# DB round trip for all callers inside this window (seconds)
+_DASHBOARD_SUMMARY_TTL = 0.5
+
+# store_unified_stacks calls within this window (seconds) are coalesced
+# into a single write of the newest snapshot
+_STACKS_DEBOUNCE = 0.2
+
+# system_stats rows are buffered and written with one INSERT per batch:
+# flushed after this delay (seconds) or as soon as the batch is full
+_STATS_FLUSH_INTERVAL = 0.1
+_STATS_BATCH_MAX = 500
+
+_INSERT_STATS_QUERY = "INSERT INTO system_stats $rows"
+
+# Read-cache lifetimes (seconds); writes through this service invalidate
+# the affected entries, so these only bound staleness from other writers
+_STACKS_CACHE_TTL = 2.0
+_STATS_CACHE_TTL = 30.0
+
+# The only system_stats columns get_dashboard_summary reads
+_DASHBOARD_FIELDS = [
+    "cpu_percent", "memory_percent", "disk_percent",
+    "network_bytes_sent", "network_bytes_recv",
+]
+
+# Record-ID range over the time-series keys; the bounds are integers we
+# compute ourselves, the projection comes from _select_clause
+_STATS_RANGE_QUERY = "SELECT {fields} FROM system_stats:⟨[{start}]⟩..⟨[{end}]⟩"
+
+@lru_cache(maxsize=64)
+def _projection(fields: Tuple[str, ...]) -> str:
+    for field in fields:
+        if not field.isidentifier():
+            raise ValueError(f"Invalid system_stats field name: {field!r}")
+    return ", ".join(("id", *fields))
+
+def _select_clause(fields: Optional[List[str]]) -> str:
+    """Build a SELECT projection; `id` is always kept for timestamp extraction"""
+    if not fields:
+        return "*"
+    # Validated and joined once per distinct field list
+    return _projection(tuple(fields))
+
+def _stack_digest(stack: Dict) -> bytes:
+    """Canonical change-detection digest of a single stack"""
+    # orjson sorts keys and emits bytes directly, in C. blake2b is the
+    # fastest hash in the stdlib on 64-bit CPUs; 16 bytes is plenty here
+    return hashlib.blake2b(
+        orjson.dumps(stack, option=orjson.OPT_SORT_KEYS, default=str),
+        digest_size=16
+    ).digest()
+
+def _keyable_stacks(stacks: List[Dict]) -> Tuple[List[Dict], List[str]]:
+    """Split off stacks that can't be keyed by name
+
+    unified_stack records are keyed by stack name inside one transaction, so
+    a stack without a name or with a name seen earlier in the list would
+    fail the write for every stack. Returns (keyable stacks, reasons for
+    the skipped ones); the input list itself comes back when nothing is
+    skipped.
+    """
+    seen = set()
+    keyable = []
+    skipped = []
+    for index, stack in enumerate(stacks):
+        name = stack.get("name")
+        if not isinstance(name, str) or not name:
+            skipped.append(f"#{index} (no name)")
+        elif name in seen:
+            skipped.append(f"{name!r} (duplicate)")
+        else:
+            seen.add(name)
+            keyable.append(stack)
+    return (keyable if skipped else stacks), skipped
+
+def _digest_stacks(stacks: List[Dict], previous: Dict[str, Tuple[Dict, bytes]]) -> Dict[str, Tuple[Dict, bytes]]:
+    """Map stack name -> (stack, digest), reusing digests of untouched stacks
+
+    A stack handed over as the very same dict object as last time keeps its
+    previous digest instead of being serialized again.
+    """
+    digests = {}
+    for stack in stacks:
+        name = stack.get("name")
+        entry = previous.get(name)
+        if entry is None or entry[0] is not stack:
+            entry = (stack, _stack_digest(stack))
+        digests[name] = entry
+    return digests
+
+async def _query_checked(db: AsyncSurreal, query: str, vars: Optional[Dict[str, Any]] = None) -> List[Any]:
+    """Run a (multi-statement) query and raise if any statement failed
+
+    db.query() only checks the first statement's status, so a cancelled
+    transaction would otherwise come back as a normal result. Returns the
+    per-statement results.
+    """
+    response = await db.query_raw(query, vars)
+    error = response.get("error")
+    if error is not None:
+        raise Exception(f"SurrealDB query failed: {error}")
+    results = response.get("result") or []
+    for statement in results:
+        if statement.get("status") == "ERR":
+            raise Exception(f"SurrealDB statement failed: {statement.get('result')}")
+    return [statement.get("result") for statement in results]
+
+def _connection_alive(db: AsyncSurreal) -> bool:
+    """Whether a connection's websocket receive loop is still running
+
+    When the socket drops, the SDK's receive task just ends: pending calls
+    are cancelled and live-query iterators keep waiting, nothing raises.
+    Connections without a receive task (HTTP) are treated as alive.
+    """
+    if not hasattr(db, "recv_task"):
+        return True
+    task = db.recv_task
+    return task is not None and not task.done()
+
+def surreal_json_default(obj: Any) -> str:
+    """orjson `default` hook so raw SurrealDB results encode without a pre-walk
+
+    orjson already writes datetimes natively; only the SurrealDB id types
+    need help.
+    """
+    if isinstance(obj, (RecordID, Table)):
         return str(obj)
-    elif isinstance(obj, dict):
-        return {key: serialize_surrealdb_objects(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [serialize_surrealdb_objects(item) for item in obj]
-    elif isinstance(obj, tuple):
-        return [serialize_surrealdb_objects(item) for item in obj]
-    elif isinstance(obj, datetime):
-        return obj.isoformat()
-    else:
-        return obj
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+# Per-type handlers for serialize_surrealdb_objects: None leaves the value as-is,
+# _WALK marks a container to descend into, anything else converts the value
+_WALK = object()
+_UNRESOLVED = object()
+
+# Checked in order with issubclass for types not already in _DISPATCH
+_BASE_HANDLERS = (
+    ((RecordID, Table), str),
+    (datetime, datetime.isoformat),
+    (dict, _WALK),
+    ((list, tuple), _WALK),
+)
+
+_DISPATCH: Dict[type, Any] = {
+    str: None, int: None, float: None, bool: None, type(None): None,
+    RecordID: str, Table: str, datetime: datetime.isoformat,
+    dict: _WALK, list: _WALK, tuple: _WALK,
+}
+
+def _handler_for(cls: type) -> Any:
+    """Resolve (and cache) the handler for a type, honouring subclasses"""
+    handler = _DISPATCH.get(cls, _UNRESOLVED)
+    if handler is _UNRESOLVED:
+        handler = None
+        for base, candidate in _BASE_HANDLERS:
+            if issubclass(cls, base):
+                handler = candidate
+                break
+        _DISPATCH[cls] = handler
+    return handler
+
+def _iter_children(container: Any):
+    return iter(container.items()) if isinstance(container, dict) else enumerate(container)
+
+def _shallow_copy(container: Any) -> Any:
+    return dict(container) if isinstance(container, dict) else list(container)
+
+def _writable(container: Any) -> Any:
+    return list(container) if isinstance(container, tuple) else container
+
+def serialize_surrealdb_objects(obj: Any, in_place: bool = False) -> Any:
+    """Convert SurrealDB objects to JSON-serializable types
+
+    Walks nested dicts/lists iteratively with a per-type dispatch table.
+    Containers that hold nothing to convert are returned as-is rather than
+    rebuilt, so already JSON-friendly subtrees cost no allocations.
+    Tuples always come back as lists.
+
+    With in_place=True, dicts and lists are converted where they stand
+    instead of being copied; only use it on data nobody else holds, such
+    as a fresh query result.
+    """
+    handler = _handler_for(type(obj))
+    if handler is not _WALK:
+        return obj if handler is None else handler(obj)
+    
+    make_writable = _writable if in_place else _shallow_copy
+
+    # Explicit stack of [source, child iterator, copy (or None), key in parent]
+    stack = [[obj, _iter_children(obj), None, None]]
+    while True:
+        frame = stack[-1]
+        for key, value in frame[1]:
+            handler = _DISPATCH.get(type(value), _UNRESOLVED)
+            if handler is _UNRESOLVED:
+                handler = _handler_for(type(value))
+            if handler is None:
+                continue
+            if handler is _WALK:
+                stack.append([value, _iter_children(value), None, key])
+                break
+            # Copy-on-write: only copy a container once a child actually changes
+            if frame[2] is None:
+                frame[2] = make_writable(frame[0])
+            frame[2][key] = handler(value)
+        else:
+            stack.pop()
+            source, _, out, key = frame
+            if out is None:
+                out = list(source) if isinstance(source, tuple) else source
+            if not stack:
+                return out
+            parent = stack[-1]
+            if out is not source:
+                if parent[2] is None:
+                    parent[2] = make_writable(parent[0])
+                parent[2][key] = out
+
+class SurrealPool:
+    """
+    Bounded pool of authenticated AsyncSurreal connections.
+    Each connection serves one caller at a time, so concurrent reads/writes
+    no longer queue behind each other on a single websocket. `min_size`
+    connections are opened up front, more are opened on demand up to
+    `max_size`, and a connection whose operation raised is closed and
+    replaced lazily instead of being handed out again. When all `max_size`
+    connections are busy, callers wait at most `timeout` seconds for one.
+    """
+
+    def __init__(self, min_size: int, max_size: int, timeout: Optional[float] = None):
+        self.min_size = min(min_size, max_size)
+        self.max_size = max_size
+        self.timeout = timeout
+        self._factory: Optional[Callable[[], Awaitable[AsyncSurreal]]] = None
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._connections: List[AsyncSurreal] = []
+        # One slot per borrowed connection. Releasing or discarding a
+        # connection frees its slot, waking a waiter that then reuses an
+        # idle connection or opens a replacement
+        self._slots = asyncio.Semaphore(max_size)
+        self._closed = False
+
+    async def open(self, factory: Callable[[], Awaitable[AsyncSurreal]]):
+        """Open `min_size` connections using the given connection factory"""
+        self._factory = factory
+        try:
+            for _ in range(self.min_size):
+                self._idle.put_nowait(await self._open_one())
+        except Exception:
+            await self.close()
+            raise
+
+    async def _open_one(self) -> AsyncSurreal:
+        db = await self._factory()
+        self._connections.append(db)
+        return db
+
+    async def _discard(self, db: AsyncSurreal):
+        if db in self._connections:
+            self._connections.remove(db)
+        try:
+            await db.close()
+        except Exception as e:
+            logger.debug(f"Error closing discarded SurrealDB connection: {e}")
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[AsyncSurreal]:
+        """Borrow a connection for the duration of the `async with` block"""
+        # Bounded wait, so a stalled server fails requests instead of piling them up
+        await asyncio.wait_for(self._slots.acquire(), self.timeout)
+        try:
+            if self._closed:
+                raise Exception("SurrealDB connection pool is closed")
+            # Holding a slot, the pool is below max_size whenever nothing is idle
+            db = self._idle.get_nowait() if not self._idle.empty() else await self._open_one()
+        except BaseException:
+            self._slots.release()
+            raise
+        
+        healthy = False
+        try:
+            yield db
+            healthy = True
+        except asyncio.CancelledError:
+            # A dropped socket also cancels the SDK's pending calls, so only
+            # a caller-side cancellation leaves the connection reusable
+            healthy = _connection_alive(db)
+            raise
+        finally:
+            try:
+                if healthy and not self._closed:
+                    self._idle.put_nowait(db)
+                else:
+                    # Also covers connections still borrowed when the pool closed
+                    await self._discard(db)
+            finally:
+                self._slots.release()
+
+    async def close(self):
+        """Close every connection owned by the pool
+        
+        Idle connections are closed here; borrowed ones are closed when
+        they are released.
+        """
+        self._closed = True
+        while not self._idle.empty():
+            await self._discard(self._idle.get_nowait())
+
+
+@dataclass(slots=True)
+class LiveQuery:
+    """Registry entry for one SurrealDB live query and its local subscribers"""
+    table: str
+    callbacks: Dict[str, Tuple[Callable, bool, bool]]  # handle -> (callback, is_coro, batch)
+    subscription: Any
+    task: Optional[asyncio.Task] = None      # Listener: subscription -> queue
+    consumer: Optional[asyncio.Task] = None  # Consumer: queue -> callbacks
+
+    def tasks(self) -> Tuple[asyncio.Task, ...]:
+        return tuple(task for task in (self.task, self.consumer) if task)
+
+
+class QueryCache:
+    """
+    Small TTL + LRU cache for read results.
+    Concurrent misses on the same key share one load instead of each
+    querying the database; empty results are never cached. Keys start with
+    a kind (e.g. "stacks") that invalidate() drops as a group.
+    """
+
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        # Key -> [lock, callers holding or waiting on it]; dropped at zero so
+        # one-off keys (e.g. arbitrary field lists) don't accumulate
+        self._locks: Dict[Tuple, List[Any]] = {}
+        # Kind -> invalidation count, so a load that raced a write isn't cached
+        self._generations: Dict[str, int] = {}
+
+    def get(self, key: Tuple) -> Any:
+        """Fresh cached value for `key`, or None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: Tuple, value: Any, ttl: float):
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get_or_load(self, key: Tuple, ttl: float, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value, or run `loader` once for all concurrent misses"""
+        value = self.get(key)
+        if value is not None:
+            return value
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                value = self.get(key)
+                if value is None:
+                    generation = self._generations.get(key[0], 0)
+                    value = await loader()
+                    # Invalidated mid-load: the value may predate the write
+                    if value and self._generations.get(key[0], 0) == generation:
+                        self.put(key, value, ttl)
+                return value
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._locks[key]
+
+    def invalidate(self, kind: str):
+        """Drop every entry whose key starts with `kind`, and any load in flight"""
+        self._generations[kind] = self._generations.get(kind, 0) + 1
+        for key in [key for key in self._entries if key[0] == kind]:
+            del self._entries[key]
+
 
 class SurrealDBService:
     """
@@ -42,46 +472,85 @@ class SurrealDBService:
     """
     
     def __init__(self):
-        self.db: Optional[AsyncSurreal] = None
+        self.db: Optional[AsyncSurreal] = None  # Dedicated connection for live queries
+        self._pool: Optional[SurrealPool] = None
         self.connected: bool = False
-        self.live_queries: Dict[str, Dict] = {}
+        self.live_queries: Dict[str, LiveQuery] = {}
         self._connection_lock = asyncio.Lock()
         self._shutdown_requested: bool = False
-        self._last_stacks_hash: Optional[str] = None
+        # Stack name -> (stack, digest) as last written; None until the table
+        # contents are known, which forces a full replace on the next write
+        self._stack_digests: Optional[Dict[str, Tuple[Dict, bytes]]] = None
+        self._skipped_stacks: List[str] = []
+        self._last_stacks_ref: Optional[List[Dict]] = None
+        self._live_tables: Dict[str, str] = {}  # Table -> live id shared by its subscribers
+        self._live_handles: Dict[str, str] = {}  # Subscriber handle -> table
+        self._live_lock = asyncio.Lock()
+        self._live_restore_task: Optional[asyncio.Task] = None
+        self._pending_stacks: Optional[Tuple[List[Dict], Optional[bool]]] = None
+        self._stacks_flush: Optional[asyncio.Task] = None
+        self._stacks_lock = asyncio.Lock()  # One stacks write (and digest update) at a time
+        self._cache = QueryCache()
+        self._stats_buffer: List[Dict] = []
+        self._stats_full = asyncio.Event()
+        self._stats_flush_task: Optional[asyncio.Task] = None
 
     # =============================================================================
     # CONNECTION MANAGEMENT (SurrealDB 2.x Compatible)
     # =============================================================================
 
+    async def _open_connection(self) -> AsyncSurreal:
+        """Open, authenticate and scope a new AsyncSurreal connection"""
+        # Create AsyncSurreal instance - v2.x pattern
+        db = AsyncSurreal(settings.SURREALDB_URL)
+        
+        # Connect to database
+        await db.connect()
+        
+        # Authenticate using v2.x signin pattern for the configured auth level
+        await db.signin(_AUTH_PAYLOADS[settings.SURREALDB_AUTH_MODE]())
+        
+        # Use namespace and database
+        await db.use(settings.SURREALDB_NS, settings.SURREALDB_DB)
+        return db
+
     async def connect(self):
         """Connect to SurrealDB using v2.x connection pattern"""
+        # Fast path: already connected, don't round-trip through the lock
+        if self.connected:
+            return
+        
         async with self._connection_lock:
-            if self.connected and self.db:
+            if self.connected:
                 return
                 
             try:
-                # Create AsyncSurreal instance - v2.x pattern
-                self.db = AsyncSurreal(settings.SURREALDB_URL)
-                
-                # Connect to database
-                await self.db.connect()
+                # Long-lived connection for live queries (never returned to the pool)
+                self.db = await self._open_connection()
+                self._watch_live_connection(self.db)
                 
-                # Authenticate using v2.x signin pattern
-                await self.db.signin({
-                    "username": settings.SURREALDB_USER, 
-                    "password": settings.SURREALDB_PASS
-                })
-                
-                # Use namespace and database
-                await self.db.use(settings.SURREALDB_NS, settings.SURREALDB_DB)
+                # Pooled connections for regular reads/writes
+                self._pool = SurrealPool(
+                    settings.SURREALDB_POOL_MIN_SIZE,
+                    settings.SURREALDB_POOL_SIZE,
+                    settings.SURREALDB_POOL_TIMEOUT
+                )
+                await self._pool.open(self._open_connection)
+                await self._ensure_schema()
                 
                 self.connected = True
-                logger.info(f"✅ Connected to SurrealDB v2.x at {settings.SURREALDB_URL}")
+                logger.info(f"✅ Connected to SurrealDB v2.x at {settings.SURREALDB_URL} (pool {self._pool.min_size}-{self._pool.max_size})")
                 
             except Exception as e:
                 logger.error(f"❌ Failed to connect to SurrealDB v2.x: {e}")
                 self.connected = False
+                if self.db:
+                    try:
+                        await self.db.close()
+                    except Exception:
+                        pass
                 self.db = None
+                self._pool = None
                 raise
 
     async def disconnect(self):
@@ -89,9 +558,26 @@ class SurrealDBService:
         async with self._connection_lock:
             self._shutdown_requested = True
             
-            # Kill all live queries before disconnecting
-            for live_id in list(self.live_queries.keys()):
-                await self.kill_live_query(live_id)
+            if self._live_restore_task and not self._live_restore_task.done():
+                self._live_restore_task.cancel()
+            
+            # Kill all live queries before disconnecting; kills are independent,
+            # so issue them together over a snapshot of the handles
+            await asyncio.gather(
+                *(self.kill_live_query(handle) for handle in list(self._live_handles)),
+                return_exceptions=True
+            )
+            
+            # Write out any buffered system stats while the pool is still open
+            if self._stats_flush_task and not self._stats_flush_task.done():
+                self._stats_full.set()
+                await asyncio.gather(self._stats_flush_task, return_exceptions=True)
+            if self._pool:
+                await self._flush_stats()
+            
+            if self._pool:
+                await self._pool.close()
+                self._pool = None
             
             if self.db:
                 try:
@@ -103,76 +589,300 @@ class SurrealDBService:
                     self.db = None
                     self.connected = False
 
+    async def _ensure_schema(self):
+        """Define the indexes hot queries rely on (idempotent)"""
+        try:
+            async with self._pool.acquire() as db:
+                await db.query(_SCHEMA_QUERY)
+        except Exception as e:
+            # Queries still work without the index, just with a table scan
+            logger.warning(f"⚠️ Could not define SurrealDB indexes: {e}")
+
+    async def _ready(self) -> bool:
+        """Whether the service is connected, connecting on first use"""
+        if self.connected:
+            return True
+        try:
+            await self.connect()
+        except Exception:
+            return False  # connect() already logged the failure
+        return self.connected
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[AsyncSurreal]:
+        """Borrow a pooled connection for ad-hoc queries (keeps `db` free for live queries)"""
+        async with self._pool.acquire() as db:
+            yield db
+
     # =============================================================================
     # LIVE QUERIES (SurrealDB 2.x Pattern)
     # =============================================================================
 
-    async def create_live_query(self, table_name: str, callback: Callable) -> str:
-        """Create a live query for a table - ENHANCED DEBUG"""
-        if not self.connected and not await self.connect():
+    async def create_live_query(self, table_name: str, callback: Callable, *, batch: bool = False) -> str:
+        """Create a live query for a table - ENHANCED DEBUG
+        
+        Subscribers to the same table share one SurrealDB live query; each
+        gets its own handle, which stays valid for kill_live_query even if
+        the query is transparently re-subscribed after the live connection
+        drops.
+        
+        With batch=True the callback receives a list of every update that
+        queued up while it was busy, instead of one call per update - a
+        burst then costs the subscriber a single round of work.
+        """
+        if not await self._ready():
             raise Exception(f"Cannot create live query: SurrealDB not connected")
         
+        handle = str(uuid.uuid4())
+        # Decide once whether the callback must be awaited
+        subscriber = (callback, asyncio.iscoroutinefunction(callback), batch)
+        
         try:
-            
-            # Use the live() method - SurrealDB 2.x pattern
-            live_query_id = await self.db.live(table_name)
-            
-            # Subscribe to the live query using subscribe_live()
-            subscription = await self.db.subscribe_live(live_query_id)
-            
-            # Store live query info
-            self.live_queries[live_query_id] = {
-                "table": table_name,
-                "callback": callback,
-                "subscription": subscription,
-                "task": None
-            }
-            
-            # Start listening task
-            listen_task = asyncio.create_task(
-                self._listen_to_live_query(live_query_id, subscription, callback)
-            )
-            self.live_queries[live_query_id]["task"] = listen_task          
-            logger.info(f"📡 Created live query for '{table_name}': {live_query_id}")
-            return live_query_id
+            async with self._live_lock:
+                live_id = self._live_tables.get(table_name)
+                query_info = self.live_queries.get(live_id)
+                if query_info is not None and query_info.consumer and query_info.consumer.done():
+                    # Nothing would deliver to a new subscriber; replace it
+                    await self._drop_live_query(live_id, query_info)
+                    query_info = None
+                if query_info is None:
+                    live_id = await self._subscribe_live_query(table_name, {handle: subscriber})
+                else:
+                    query_info.callbacks[handle] = subscriber
+                    logger.info(f"📡 Joined live query for '{table_name}': {live_id}")
+                self._live_handles[handle] = table_name
+            return handle
                 
         except Exception as e:
             logger.error(f"❌ Failed to create live query for {table_name}: {e}")
             print(f"🐛 LIVE QUERY SETUP: Error creating live query: {e}")
             raise
 
-    async def _listen_to_live_query(self, live_id: str, subscription: Any, callback: Callable):
-        """Listen to live query updates in a background task - ENHANCED DEBUG"""
+    async def _subscribe_live_query(self, table_name: str, callbacks: Dict[str, Tuple[Callable, bool, bool]]) -> str:
+        """Issue LIVE on the dedicated connection, register it and start its listener"""
+        # Use the live() method - SurrealDB 2.x pattern
+        live_query_id = await self.db.live(table_name)
+        
+        # Subscribe to the live query using subscribe_live()
+        subscription = await self.db.subscribe_live(live_query_id)
+        
+        # Bounded buffer between the subscription and the callbacks, drained
+        # by a single consumer so a slow callback cannot pile up work
+        queue = asyncio.Queue(maxsize=settings.SURREALDB_LIVE_QUEUE_SIZE)
+        
+        # Store live query info - this doubles as the registry used to
+        # re-subscribe everything after the live connection is lost
+        self.live_queries[live_query_id] = LiveQuery(
+            table=table_name,
+            callbacks=callbacks,
+            subscription=subscription,
+            task=asyncio.create_task(
+                self._listen_to_live_query(live_query_id, subscription, queue)
+            ),
+            consumer=asyncio.create_task(
+                self._consume_live_query(live_query_id, queue, callbacks)
+            )
+        )
+        self._live_tables[table_name] = live_query_id
+        logger.info(f"📡 Created live query for '{table_name}': {live_query_id}")
+        return live_query_id
+
+    async def _listen_to_live_query(self, live_id: str, subscription: Any, queue: asyncio.Queue):
+        """Listen to live query updates in a background task - ENHANCED DEBUG
+        
+        Updates are only queued here; when the queue is full the oldest or
+        newest update is dropped according to SURREALDB_LIVE_QUEUE_DROP.
+        """
+        drop_oldest = settings.SURREALDB_LIVE_QUEUE_DROP == "oldest"
+        put_nowait = queue.put_nowait  # Bound once, used for every update
         try:
             
             async for update in subscription:
                 
                 if self._shutdown_requested:
                     break
-                    
+                
                 try:
-                    # Call the callback with the update data
-                    await callback(update)
-                except Exception as e:
-                    logger.error(f"Error in live query callback for {live_id}: {e}")
+                    put_nowait(update)
+                except asyncio.QueueFull:
+                    if not drop_oldest:
+                        logger.warning(f"⚠️ Live query {live_id} queue full, dropping newest update")
+                        continue
+                    queue.get_nowait()
+                    queue.task_done()
+                    put_nowait(update)
+                    logger.warning(f"⚠️ Live query {live_id} queue full, dropped oldest update")
                     
         except Exception as e:
             if not self._shutdown_requested:
                 logger.error(f"Error listening to live query {live_id}: {e}")
+                self._schedule_live_restore()
         finally:
             logger.debug(f"Live query listener {live_id} stopped")
 
-    async def kill_live_query(self, live_id: str):
-        """Kill a live query and cleanup resources"""
-        try:
+    async def _consume_live_query(self, live_id: str, queue: asyncio.Queue, callbacks: Dict[str, Tuple[Callable, bool, bool]]):
+        """Fan queued updates out to every subscriber, in arrival order
+        
+        Each wake-up takes everything already queued. Batch subscribers get
+        it as one list, the rest one call per update. Coroutine functions
+        are awaited, plain callables are invoked directly (awaiting any
+        awaitable they return). A failing callback doesn't stop the others.
+        """
+        while True:
+            updates = [await queue.get()]
+            while not queue.empty():
+                updates.append(queue.get_nowait())
+            try:
+                for callback, is_coro, batch in list(callbacks.values()):
+                    for payload in ((updates,) if batch else updates):
+                        try:
+                            if is_coro:
+                                await callback(payload)
+                            else:
+                                result = callback(payload)
+                                if inspect.isawaitable(result):
+                                    await result
+                        except Exception as e:
+                            logger.error(f"Error in live query callback for {live_id}: {e}")
+            finally:
+                for _ in updates:
+                    queue.task_done()
+            if not callbacks:
+                return  # Last subscriber detached from inside a callback
+
+    def _watch_live_connection(self, db: AsyncSurreal):
+        """Restore live queries as soon as `db`'s receive loop ends
+        
+        A dropped socket never surfaces as an error in the live-query
+        listeners, so the receive task is the only reliable signal.
+        """
+        task = getattr(db, "recv_task", None)
+        if task is not None:
+            task.add_done_callback(lambda _: self._on_live_connection_lost(db))
+
+    def _on_live_connection_lost(self, db: AsyncSurreal):
+        if db is not self.db or self._shutdown_requested:
+            return  # Replaced by a restore, or closed on purpose
+        logger.warning("⚠️ Live query connection lost, restoring live queries")
+        self._schedule_live_restore()
+
+    def _schedule_live_restore(self):
+        """Start (at most one) background restore of the live-query connection"""
+        if self._shutdown_requested:
+            return
+        if self._live_restore_task and not self._live_restore_task.done():
+            return
+        self._live_restore_task = asyncio.create_task(self._restore_live_queries())
+
+    async def _restore_live_queries(self):
+        """Reopen the dedicated live-query connection with backoff, then re-subscribe
+        
+        Retried (with the same backoff) until every registered live query
+        is re-subscribed, since entries that failed have no listener left
+        to report the next connection loss.
+        """
+        delay = 1.0
+        while not self._shutdown_requested:
+            try:
+                new_db = await self._open_connection()
+            except Exception as e:
+                logger.warning(f"⚠️ Live query connection retry in {delay:.0f}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _LIVE_RESTORE_MAX_DELAY)
+                continue
+            
+            old_db, self.db = self.db, new_db
+            self._watch_live_connection(new_db)
+            if old_db:
+                try:
+                    await old_db.close()
+                except Exception:
+                    pass
+            
+            async with self._live_lock:
+                if await self._resubscribe_all():
+                    return
+            
+            logger.warning(f"⚠️ Live query re-subscribe retry in {delay:.0f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _LIVE_RESTORE_MAX_DELAY)
+
+    async def _resubscribe_all(self) -> bool:
+        """Re-issue every registered live query on the current live connection
+        
+        Returns False if any of them could not be re-subscribed.
+        """
+        restored = True
+        for old_id, query_info in list(self.live_queries.items()):
+            if self.live_queries.get(old_id) is not query_info:
+                continue  # Removed since the snapshot was taken
+            if not query_info.callbacks:
+                # No subscribers left to deliver to: drop it rather than revive it
+                await self._drop_live_query(old_id, query_info)
+                continue
+            try:
+                # The callbacks dict moves over as-is, so subscriber handles stay valid
+                new_id = await self._subscribe_live_query(query_info.table, query_info.callbacks)
+            except Exception as e:
+                # Keep the old entry (and its tasks) registered for the next attempt
+                logger.error(f"❌ Failed to re-subscribe live query for {query_info.table}: {e}")
+                restored = False
+                continue
+            
+            self._cancel_live_tasks(query_info)
+            self.live_queries.pop(old_id, None)
+            logger.info(f"🔁 Re-subscribed live query for '{query_info.table}': {old_id} -> {new_id}")
+        return restored
+
+    @staticmethod
+    def _cancel_live_tasks(query_info: LiveQuery):
+        """Stop the listener and consumer tasks of a registered live query
+        
+        The current task is left alone, so a callback detaching itself from
+        inside the consumer isn't cancelled mid-teardown; that consumer stops
+        by itself once it has no subscribers left.
+        """
+        current = asyncio.current_task()
+        for task in query_info.tasks():
+            if task is not current and not task.done():
+                task.cancel()
+
+    async def kill_live_query(self, handle: str):
+        """Detach a subscriber; the live query itself is killed with its last subscriber"""
+        # Under _live_lock, so a kill can't interleave with a restore that
+        # would otherwise revive the query from its registry snapshot
+        async with self._live_lock:
+            table_name = self._live_handles.pop(handle, None)
+            live_id = self._live_tables.get(table_name)
             query_info = self.live_queries.get(live_id)
-            if query_info:
-                # Cancel the listening task
-                if query_info["task"] and not query_info["task"].done():
-                    query_info["task"].cancel()
-                
-                # Remove from tracking
-                del self.live_queries[live_id]
+            if query_info is None:
+                return
+            
+            query_info.callbacks.pop(handle, None)
+            if query_info.callbacks:
+                logger.info(f"🛑 Detached live query subscriber {handle} from '{table_name}'")
+                return
+            
+            # Last subscriber gone
+            await self._drop_live_query(live_id, query_info)
+
+    async def _drop_live_query(self, live_id: str, query_info: LiveQuery):
+        """Stop a registered live query's tasks, unregister it and kill it on SurrealDB"""
+        try:
+            # Cancel the listening and consumer tasks
+            self._cancel_live_tasks(query_info)
+            
+            # Remove from tracking (pop, so a concurrent kill is harmless)
+            self.live_queries.pop(live_id, None)
+            if self._live_tables.get(query_info.table) == live_id:
+                self._live_tables.pop(query_info.table, None)
+            
+            # Let the tasks finish unwinding before the server-side kill
+            current = asyncio.current_task()
+            await asyncio.gather(
+                *(task for task in query_info.tasks() if task is not current),
+                return_exceptions=True
+            )
             
             # Kill the live query on SurrealDB
             if self.db and not self._shutdown_requested:
@@ -187,31 +897,102 @@ class SurrealDBService:
     # UNIFIED STACKS STORAGE
     # =============================================================================
 
-    async def store_unified_stacks(self, stacks: List[Dict]) -> bool:
-        """Store unified stacks data with change detection"""
+    async def store_unified_stacks(self, stacks: List[Dict], *,
+                                   known_changed: Optional[bool] = None) -> bool:
+        """
+        Store unified stacks data with change detection
+        
+        Passing the very same list object as the last stored/unchanged call
+        returns immediately without hashing, so callers should hand over a
+        new list when the snapshot changes rather than mutating it in place.
+        
+        Callers that already know whether the snapshot changed can say so via
+        `known_changed`: False returns straight away, True writes without
+        hashing (even for a list mutated in place). Leave it as None to fall
+        back to identity and hash-based detection.
+        
+        Calls arriving within _STACKS_DEBOUNCE of each other are coalesced:
+        only the latest snapshot is stored and every caller gets its result.
+        If any of them passed known_changed=True, the write is forced.
+        """
+        if self._shutdown_requested or known_changed is False:
+            return False
+        
+        pending = self._pending_stacks
+        if pending is not None and pending[1]:
+            # An earlier call in this window already knows a write is due;
+            # only the snapshot is replaced, never that verdict
+            known_changed = True
+        self._pending_stacks = (stacks, known_changed)
+        if self._stacks_flush is None:
+            self._stacks_flush = asyncio.create_task(self._flush_pending_stacks())
+        # Shielded so one caller being cancelled doesn't cancel the shared write
+        return await asyncio.shield(self._stacks_flush)
+
+    async def _flush_pending_stacks(self) -> bool:
+        """Wait out the debounce window, then store the latest pending snapshot"""
+        await asyncio.sleep(_STACKS_DEBOUNCE)
+        stacks, known_changed = self._pending_stacks
+        self._pending_stacks = None
+        self._stacks_flush = None  # Later calls start a new window
+        async with self._stacks_lock:
+            return await self._store_unified_stacks_now(stacks, known_changed)
+
+    async def _store_unified_stacks_now(self, stacks: List[Dict], known_changed: Optional[bool]) -> bool:
         if self._shutdown_requested:
             return False
+        
+        if known_changed is None and stacks is self._last_stacks_ref:
+            return False  # Same snapshot object as last time
             
-        if not self.connected and not await self.connect():
+        if not await self._ready():
             logger.error("❌ Cannot store unified stacks - SurrealDB not connected")
             return False
 
+        snapshot = stacks
+        stacks, skipped = _keyable_stacks(stacks)
+        if skipped != self._skipped_stacks:
+            # Logged when the set changes, not on every sync of the same snapshot
+            if skipped:
+                logger.warning(f"⚠️ Skipping unified stacks that can't be keyed by name: {', '.join(skipped)}")
+            self._skipped_stacks = skipped
+
         try:
-            # Calculate hash of current stacks for change detection
-            stacks_json = json.dumps(stacks, sort_keys=True)
-            current_hash = hashlib.md5(stacks_json.encode()).hexdigest()
-            
-            # Only write if data has changed
-            if current_hash == self._last_stacks_hash:
-                return False  # No changes
+            if known_changed:
+                await self._replace_stacks(stacks)
+                # Nothing was digested, so the next undecided call must re-baseline
+                self._stack_digests = None
+                self._last_stacks_ref = snapshot
+                return True
             
-            # Clear existing data and insert new
-            await self.db.query("DELETE FROM unified_stack")
+            previous = self._stack_digests
+            digests = await self._digest_stacks(stacks)
             
-            for stack in stacks:
-                await self.db.create("unified_stack", stack)
+            if previous is None:
+                await self._replace_stacks(stacks)
+            else:
+                # Only stacks whose digest moved are written; the old names
+                # we don't see any more are deleted in the same transaction
+                changed = [
+                    entry[0] for name, entry in digests.items()
+                    if name not in previous or previous[name][1] != entry[1]
+                ]
+                removed = [name for name in previous if name not in digests]
+                
+                if not changed and not removed:
+                    self._stack_digests = digests
+                    self._last_stacks_ref = snapshot
+                    return False  # No changes
+                
+                # When most stacks churn, clearing and re-inserting is cheaper
+                # for the server than upserting nearly every record one by one
+                if len(changed) + len(removed) > len(previous) * _STACK_CHURN_REPLACE_RATIO:
+                    await self._replace_stacks(stacks)
+                else:
+                    await self._apply_stack_changes(changed, removed)
             
-            self._last_stacks_hash = current_hash
+            self._stack_digests = digests
+            self._last_stacks_ref = snapshot
             return True  # Changes were made
             
         except asyncio.CancelledError:
@@ -222,21 +1003,73 @@ class SurrealDBService:
                 logger.error(f"❌ Failed to store unified stacks: {e}")
             return False
 
+    async def _digest_stacks(self, stacks: List[Dict]) -> Dict[str, Tuple[Dict, bytes]]:
+        """Per-stack digests, computed in a worker thread for large lists"""
+        previous = self._stack_digests or {}
+        if len(stacks) >= _HASH_OFFLOAD_THRESHOLD:
+            return await asyncio.to_thread(_digest_stacks, stacks, previous)
+        return _digest_stacks(stacks, previous)
+
+    async def _replace_stacks(self, stacks: List[Dict]):
+        """Replace unified_stack contents with `stacks`"""
+        # Replace the table contents in a single round trip; the transaction
+        # keeps readers from ever observing an empty unified_stack table
+        async with self._pool.acquire() as db:
+            await _query_checked(db, _REPLACE_STACKS_QUERY, {"stacks": stacks})
+        self._cache.invalidate("stacks")
+
+    async def _apply_stack_changes(self, changed: List[Dict], removed: List[str]):
+        """Upsert changed stacks and delete removed ones in one transaction"""
+        async with self._pool.acquire() as db:
+            await _query_checked(db, _APPLY_STACK_CHANGES_QUERY, {"changed": changed, "removed": removed})
+        self._cache.invalidate("stacks")
+
     async def get_unified_stacks(self) -> List[Dict]:
-        """Get unified stacks from SurrealDB"""
+        """Get unified stacks from SurrealDB (cached for _STACKS_CACHE_TTL)"""
         if self._shutdown_requested:
             return []
-            
-        if not self.connected and not await self.connect():
+        return await self._cache.get_or_load(("stacks",), _STACKS_CACHE_TTL, self._query_unified_stacks)
+
+    async def _query_unified_stacks(self) -> List[Dict]:
+        if not await self._ready():
             return []
             
         try:
-            result = await self.db.select("unified_stack")
-            return serialize_surrealdb_objects(result) if result else []
+            async with self._pool.acquire() as db:
+                result = await db.select(_STACKS_TABLE)
+            # The driver's result is ours alone, so convert it without copying
+            return serialize_surrealdb_objects(result, in_place=True) if result else []
         except Exception as e:
             logger.error(f"❌ Failed to get unified stacks: {e}")
             return []
 
+    async def get_unified_stacks_json(self) -> Tuple[bytes, int]:
+        """Unified stacks already encoded as a JSON array, plus the stack count
+        
+        For HTTP handlers that only forward the data: the raw driver result
+        is encoded by orjson directly, skipping serialize_surrealdb_objects
+        and the framework's own encoder. Cached alongside get_unified_stacks
+        and invalidated with it. Returns (b"", 0) when there is nothing stored.
+        """
+        if self._shutdown_requested:
+            return b"", 0
+        cached = await self._cache.get_or_load(("stacks", "json"), _STACKS_CACHE_TTL, self._query_unified_stacks_json)
+        return cached or (b"", 0)
+
+    async def _query_unified_stacks_json(self) -> Optional[Tuple[bytes, int]]:
+        if not await self._ready():
+            return None
+            
+        try:
+            async with self._pool.acquire() as db:
+                result = await db.select(_STACKS_TABLE)
+            if not result:
+                return None
+            return orjson.dumps(result, default=surreal_json_default), len(result)
+        except Exception as e:
+            logger.error(f"❌ Failed to get unified stacks: {e}")
+            return None
+
     # =============================================================================
     # SYSTEM STATS STORAGE
     # =============================================================================
@@ -249,7 +1082,7 @@ class SurrealDBService:
         if self._shutdown_requested:
             return
             
-        if not self.connected and not await self.connect():
+        if not await self._ready():
             logger.error("❌ Cannot store system stats - SurrealDB not connected")
             return
             
@@ -286,11 +1119,16 @@ class SurrealDBService:
             # COMPLEX RECORD ID: Use epoch timestamp for uniqueness and simplicity
             # Format: system_stats:[1692912253123] (milliseconds since epoch)
             timestamp_ms = int(current_time.timestamp() * 1000)
-            record_id = f"system_stats:[{timestamp_ms}]"
+            comprehensive_record["id"] = RecordID("system_stats", [timestamp_ms])
             
-            result = await self.db.create(record_id, comprehensive_record)
+            # Buffered; written together with other rows by _flush_stats
+            self._stats_buffer.append(comprehensive_record)
+            if len(self._stats_buffer) >= _STATS_BATCH_MAX:
+                self._stats_full.set()
+            if self._stats_flush_task is None or self._stats_flush_task.done():
+                self._stats_flush_task = asyncio.create_task(self._flush_stats_soon())
             
-            logger.debug(f"📊 Stored system stats with time-series ID: {timestamp_ms}")
+            logger.debug("📊 Queued system stats with time-series ID: %s", timestamp_ms)
             
         except asyncio.CancelledError:
             logger.info("📡 System stats storage cancelled during shutdown")
@@ -298,57 +1136,95 @@ class SurrealDBService:
             if not self._shutdown_requested:
                 logger.error(f"❌ Failed to store system stats with complex ID: {e}")
 
-    async def get_system_stats_latest_timeseries(self) -> Dict:
-        """Get latest system stats using correct SurrealDB time-series syntax"""
+    async def _flush_stats_soon(self):
+        """Wait for the batch window (or a full batch), then write the buffer"""
+        try:
+            await asyncio.wait_for(self._stats_full.wait(), _STATS_FLUSH_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        await self._flush_stats()
+
+    async def _flush_stats(self):
+        """Write buffered system_stats rows, one INSERT per _STATS_BATCH_MAX rows"""
+        while self._stats_buffer:
+            rows = self._stats_buffer[:_STATS_BATCH_MAX]
+            del self._stats_buffer[:_STATS_BATCH_MAX]
+            if len(self._stats_buffer) < _STATS_BATCH_MAX:
+                self._stats_full.clear()
+            try:
+                async with self._pool.acquire() as db:
+                    await _query_checked(db, _INSERT_STATS_QUERY, {"rows": rows})
+                self._cache.invalidate("stats_latest")
+                logger.debug("📊 Stored %d system stats records", len(rows))
+            except Exception as e:
+                logger.error(f"❌ Failed to store {len(rows)} system stats records: {e}")
+
+    async def get_system_stats_latest_timeseries(self, fields: Optional[List[str]] = None) -> Dict:
+        """
+        Get latest system stats using correct SurrealDB time-series syntax
+        
+        Cached per projection for _STATS_CACHE_TTL; every stats flush
+        invalidates the cache, so callers still see each new sample.
+        
+        Args:
+            fields: Optional column names to project instead of SELECT *
+        """
         
         if self._shutdown_requested:
             return {}
-            
-        if not self.connected and not await self.connect():
+        return await self._cache.get_or_load(
+            ("stats_latest", tuple(fields or ())),
+            _STATS_CACHE_TTL,
+            lambda: self._query_latest_stats(fields)
+        )
+
+    async def _query_latest_stats(self, fields: Optional[List[str]]) -> Dict:
+        if not await self._ready():
             return {}
             
         try:
             # Get records from the last 1 minute (60,000 ms)
-            now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
+            now = datetime.now(timezone.utc)
+            now_ms = int(now.timestamp() * 1000)
             start_ms = now_ms - 60000  # 1 minute back
             
             # CORRECT: Use Unicode angle brackets for time-series range query
-            query = f"SELECT * FROM system_stats:⟨[{start_ms}]⟩..⟨[{now_ms}]⟩"
+            query = _STATS_RANGE_QUERY.format(fields=_select_clause(fields), start=start_ms, end=now_ms)
             
-            result = await self.db.query(query)
+            async with self._pool.acquire() as db:
+                result = await db.query(query)
             
             # Handle SurrealDB Python SDK response format
-            if result and isinstance(result, list) and len(result) > 0:
-                records = result[0] if isinstance(result[0], list) else result
-                
-                if records and len(records) > 0:
-                    # Get the last record (most recent timestamp)
-                    latest_record = records[-1]
+            records = result[0] if result and isinstance(result[0], list) else result
+            if records:
+                # Get the last record (most recent timestamp)
+                latest_record = records[-1]
                     
-                    # Extract timestamp from record ID and add timestamp fields
-                    if 'id' in latest_record:
-                        try:
-                            id_str = str(latest_record['id'])
-                            # Extract timestamp from format: system_stats:⟨[1756136800000]⟩
-                            if '⟨[' in id_str and ']⟩' in id_str:
-                                start_idx = id_str.find('⟨[') + 2
-                                end_idx = id_str.find(']⟩')
-                                timestamp_ms = int(id_str[start_idx:end_idx])
+                # Extract timestamp from record ID and add timestamp fields
+                if 'id' in latest_record:
+                    try:
+                        id_str = str(latest_record['id'])
+                        # Extract timestamp from format: system_stats:⟨[1756136800000]⟩
+                        if '⟨[' in id_str and ']⟩' in id_str:
+                            start_idx = id_str.find('⟨[') + 2
+                            end_idx = id_str.find(']⟩')
+                            timestamp_ms = int(id_str[start_idx:end_idx])
                                 
-                                timestamp_dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
-                                latest_record['timestamp'] = timestamp_dt.isoformat()
-                                latest_record['collected_at'] = latest_record['timestamp']
+                            timestamp_dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
+                            latest_record['timestamp'] = timestamp_dt.isoformat()
+                            latest_record['collected_at'] = latest_record['timestamp']
                                 
-                                logger.debug(f"📊 Retrieved latest stats: {timestamp_dt}, CPU: {latest_record.get('cpu_percent')}%")
+                            logger.debug("📊 Retrieved latest stats: %s, CPU: %s%%", timestamp_dt, latest_record.get('cpu_percent'))
                                 
-                        except (ValueError, TypeError, IndexError) as e:
-                            logger.warning(f"Could not extract timestamp from ID {latest_record.get('id')}: {e}")
-                            # Still return the record with current timestamp as fallback
-                            current_time = datetime.now(timezone.utc).isoformat()
-                            latest_record['timestamp'] = current_time
-                            latest_record['collected_at'] = current_time
+                    except (ValueError, TypeError, IndexError) as e:
+                        logger.warning(f"Could not extract timestamp from ID {latest_record.get('id')}: {e}")
+                        # Still return the record with current timestamp as fallback
+                        current_time = now.isoformat()
+                        latest_record['timestamp'] = current_time
+                        latest_record['collected_at'] = current_time
                     
-                    return latest_record
+                # Serialize only the record we return, not the whole window
+                return serialize_surrealdb_objects(latest_record, in_place=True)
             
             logger.warning("📊 No system stats records found in last minute")
             return {}
@@ -358,56 +1234,69 @@ class SurrealDBService:
                 logger.error(f"❌ Failed to get latest stats: {e}")
             return {}
 
-    async def get_system_stats_range_timeseries(self, minutes_back: int = 60) -> List[Dict]:
-        """Get system stats range using correct SurrealDB time-series syntax"""
+    async def get_system_stats_range_timeseries(
+        self,
+        minutes_back: int = 60,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Get system stats range using correct SurrealDB time-series syntax
+        
+        Args:
+            minutes_back: Size of the window ending now
+            fields: Optional column names to project instead of SELECT *
+            limit: Optional cap on records, applied by the database so the
+                rest of the window is never transferred or materialized
+        """
         
         if self._shutdown_requested:
             return []
             
-        if not self.connected and not await self.connect():
+        if not await self._ready():
             return []
             
         try:
-            # Calculate time range
-            now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
+            # Calculate time range (one clock read per batch, reused as the fallback timestamp)
+            now = datetime.now(timezone.utc)
+            now_iso = now.isoformat()
+            now_ms = int(now.timestamp() * 1000)
             start_ms = now_ms - (minutes_back * 60 * 1000)
             
             # CORRECT: Use Unicode angle brackets for time-series range query
-            query = f"SELECT * FROM system_stats:⟨[{start_ms}]⟩..⟨[{now_ms}]⟩"
+            query = _STATS_RANGE_QUERY.format(fields=_select_clause(fields), start=start_ms, end=now_ms)
+            if limit is not None:
+                query += f" LIMIT {int(limit)}"
             
-            result = await self.db.query(query)
+            async with self._pool.acquire() as db:
+                result = await db.query(query)
             
             # Handle SurrealDB Python SDK response format
-            if result and isinstance(result, list) and len(result) > 0:
-                records = result[0] if isinstance(result[0], list) else result
-                
-                if records:
-                    # Add timestamp fields to each record
-                    processed_records = []
-                    for record in records:
-                        if 'id' in record:
-                            try:
-                                id_str = str(record['id'])
-                                # Extract timestamp from format: system_stats:⟨[1756136800000]⟩
-                                if '⟨[' in id_str and ']⟩' in id_str:
-                                    start_idx = id_str.find('⟨[') + 2
-                                    end_idx = id_str.find(']⟩')
-                                    timestamp_ms = int(id_str[start_idx:end_idx])
+            records = result[0] if result and isinstance(result[0], list) else result
+            if records:
+                # Add timestamp fields to each record, in place - the driver has
+                # already materialized the result, so don't build a second list
+                for record in records:
+                    if 'id' in record:
+                        try:
+                            id_str = str(record['id'])
+                            # Extract timestamp from format: system_stats:⟨[1756136800000]⟩
+                            if '⟨[' in id_str and ']⟩' in id_str:
+                                start_idx = id_str.find('⟨[') + 2
+                                end_idx = id_str.find(']⟩')
+                                timestamp_ms = int(id_str[start_idx:end_idx])
                                     
-                                    timestamp_dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
-                                    record['timestamp'] = timestamp_dt.isoformat()
-                                    record['collected_at'] = record['timestamp']
+                                timestamp_dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
+                                record['timestamp'] = timestamp_dt.isoformat()
+                                record['collected_at'] = record['timestamp']
                                     
-                            except (ValueError, TypeError, IndexError):
-                                # Add fallback timestamp for records we can't parse
-                                current_time = datetime.now(timezone.utc).isoformat()
-                                record['timestamp'] = current_time
-                                record['collected_at'] = current_time
-                        
-                        processed_records.append(record)
+                        except (ValueError, TypeError, IndexError):
+                            # Add fallback timestamp for records we can't parse
+                            record['timestamp'] = now_iso
+                            record['collected_at'] = now_iso
                     
-                    logger.debug(f"📊 Retrieved {len(processed_records)} stats records from last {minutes_back} minutes")
-                    return processed_records
+                logger.debug("📊 Retrieved %d stats records from last %d minutes", len(records), minutes_back)
+                return records
                 
             logger.warning(f"📊 No system stats records found for last {minutes_back} minutes")
             return []
@@ -419,6 +1308,7 @@ class SurrealDBService:
     def _add_timestamps_to_records(self, records: List[Dict]) -> List[Dict]:
         """Helper method to add timestamp fields to records"""
         processed_records = []
+        now_iso = datetime.now(timezone.utc).isoformat()
         
         for record in records:
             if 'id' in record:
@@ -436,20 +1326,19 @@ class SurrealDBService:
                         
                 except (ValueError, TypeError):
                     # Add fallback timestamp for records we can't parse
-                    current_time = datetime.now(timezone.utc).isoformat()
-                    record['timestamp'] = current_time
-                    record['collected_at'] = current_time
+                    record['timestamp'] = now_iso
+                    record['collected_at'] = now_iso
                     processed_records.append(record)
         
         return processed_records
 
     # UPDATE: Replace the old get_system_stats method
-    async def get_system_stats(self, hours_back: int = 24) -> List[Dict]:
+    async def get_system_stats(self, hours_back: int = 24, fields: Optional[List[str]] = None) -> List[Dict]:
         """PHASE 4: Use time-series optimized method"""
         logger.debug("Using time-series optimized query")
         
         # For backwards compatibility, return latest record
-        latest = await self.get_system_stats_latest_timeseries()
+        latest = await self.get_system_stats_latest_timeseries(fields=fields)
         return [latest] if latest else []
 
     async def create_filtered_live_query(
@@ -469,7 +1358,7 @@ class SurrealDBService:
         Returns:
             live_query_id: UUID string for the live query
         """
-        if not self.connected and not await self.connect():
+        if not await self._ready():
             raise Exception("Cannot create filtered live query: SurrealDB not connected")
         
         # Default significance filter for Docker containers
@@ -483,10 +1372,10 @@ class SurrealDBService:
         # Create wrapper callback that filters changes
         async def filtered_callback(update_data):
             if self._is_significant_change(update_data, significance_filter):
-                logger.info(f"📡 Significant change detected, calling callback")
+                logger.info("📡 Significant change detected, calling callback")
                 await callback(update_data)
             else:
-                logger.debug(f"📡 Insignificant change ignored")
+                logger.debug("📡 Insignificant change ignored")
         
         # Create the live query with filtered callback
         return await self.create_live_query(table_name, filtered_callback)
@@ -514,15 +1403,27 @@ class SurrealDBService:
         return await self.get_system_stats(hours_back)
 
     async def get_dashboard_summary(self) -> Dict[str, Any]:
-        """Get current dashboard summary"""
+        """Get current dashboard summary (cached for _DASHBOARD_SUMMARY_TTL)"""
+        failure: Dict[str, Any] = {}
+
+        async def load() -> Optional[Dict[str, Any]]:
+            summary = await self._build_dashboard_summary()
+            if "error" in summary:
+                failure.update(summary)
+                return None  # Errors are reported, never cached
+            return summary
+
+        # Only one coroutine hits the DB per window; the rest wait and reuse it
+        return await self._cache.get_or_load(("dashboard",), _DASHBOARD_SUMMARY_TTL, load) or failure
+
+    async def _build_dashboard_summary(self) -> Dict[str, Any]:
+        """Build the dashboard summary from the latest stats record"""
         try:
-            recent_stats = await self.get_system_stats(hours_back=1)
+            latest_stat = await self.get_system_stats_latest_timeseries(fields=_DASHBOARD_FIELDS)
             
-            if not recent_stats:
+            if not latest_stat:
                 return {"error": "No recent stats available"}
             
-            latest_stat = recent_stats[0]
-            
             return {
                 'timestamp': latest_stat.get('timestamp'),
                 'collected_at': latest_stat.get('collected_at'),
@@ -547,7 +1448,7 @@ class SurrealDBService:
 
     async def store_user_event(self, event_type: str, stack_name: str, container_name: str = None, details: Dict = None) -> bool:
         """Store a user-significant event in the events table"""
-        if not self.connected and not await self.connect():
+        if not await self._ready():
             return False
         
         try:
@@ -560,7 +1461,8 @@ class SurrealDBService:
                 "processed": False
             }
             
-            await self.db.create("user_events", event_data)
+            async with self._pool.acquire() as db:
+                await db.create("user_events", event_data)
             return True
             
         except Exception as e:
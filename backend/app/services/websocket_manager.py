@@ -9,6 +9,8 @@ import orjson
 from typing import Dict, Set, Optional, Callable, Any
 from datetime import datetime, timezone
 
+from .surreal_service import surreal_json_default
+
 try:
     import picows
     from picows import WSFrame, WSTransport, WSListener, WSMsgType, WSUpgradeRequest, ws_create_server
@@ -38,7 +40,8 @@ class PicowsWebSocketClient:
             return False
             
         try:
-            data = orjson.dumps(message)
+            # SurrealDB ids in payloads are encoded by orjson itself, no pre-walk needed
+            data = orjson.dumps(message, default=surreal_json_default)
             self.transport.send(WSMsgType.BINARY, data)
             return True
         except Exception as e:
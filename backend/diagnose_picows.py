@@ -94,7 +94,8 @@ async def debug_live_updates():
                 }
                 
                 # This should trigger the system_stats live query
-                await surreal_service.db.create("system_stats", test_stats)
+                async with surreal_service.acquire() as db:
+                    await db.create("system_stats", test_stats)
                 print("   ✅ Test system stats record created - should trigger live query")
                 
                 # Wait a moment to see if the live query fires
@@ -379,7 +379,8 @@ async def write_system_stats():
         }
         
         # Write to SurrealDB to trigger live query
-        result = await surreal_service.db.create("system_stats", stats_data)
+        async with surreal_service.acquire() as db:
+            result = await db.create("system_stats", stats_data)
         
         return {
             "written_to_db": stats_data,
@@ -0,0 +1,228 @@
+# backend/tests/test_surreal_service.py
+"""
+SurrealDBService behaviour against an in-memory stand-in for the SDK's
+websocket connection - no SurrealDB server needed.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from app.services import surreal_service as surreal_module
+from app.services.surreal_service import SurrealDBService
+
+
+class FakeConnection:
+    """Mimics surrealdb 2.x AsyncWsSurrealConnection closely enough for the service"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.recv_task = None
+        self.queries = []
+        self.killed = []
+        self.live_queues = {}
+
+    async def connect(self):
+        self._dropped = asyncio.Event()
+        # Like the SDK's receive loop: it just ends when the socket drops
+        self.recv_task = asyncio.create_task(self._dropped.wait())
+
+    async def signin(self, payload):
+        pass
+
+    async def use(self, namespace, database):
+        pass
+
+    async def query(self, query, vars=None):
+        self.queries.append((query, vars))
+        return []
+
+    async def query_raw(self, query, params=None):
+        self.queries.append((query, params))
+        return {"result": [{"status": "OK", "result": []}]}
+
+    async def live(self, table):
+        live_id = str(uuid.uuid4())
+        self.live_queues[live_id] = asyncio.Queue()
+        return live_id
+
+    async def subscribe_live(self, live_id):
+        queue = self.live_queues[live_id]
+
+        async def updates():
+            # Never raises, even after the socket is gone - as in the SDK
+            while True:
+                yield await queue.get()
+
+        return updates()
+
+    async def kill(self, live_id):
+        self.killed.append(live_id)
+
+    async def close(self):
+        if self.recv_task and not self.recv_task.done():
+            self.recv_task.cancel()
+        self.recv_task = None
+
+    def drop(self):
+        """Simulate the server going away: no error reaches any caller"""
+        self._dropped.set()
+
+    def push(self, live_id, update):
+        self.live_queues[live_id].put_nowait(update)
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """Every connection the service opens, in order"""
+    opened = []
+
+    def open_connection(url):
+        connection = FakeConnection(url)
+        opened.append(connection)
+        return connection
+
+    monkeypatch.setattr(surreal_module, "AsyncSurreal", open_connection)
+    return opened
+
+
+async def wait_until(predicate, timeout: float = 2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+def test_live_queries_restored_after_silent_socket_drop(connections):
+    async def scenario():
+        service = SurrealDBService()
+        await service.connect()
+        received = []
+        await service.create_live_query("user_events", received.append)
+
+        dropped = service.db
+        dropped.drop()
+        await wait_until(
+            lambda: service.db is not dropped
+            and service._live_tables.get("user_events") in service.db.live_queues
+        )
+
+        service.db.push(service._live_tables["user_events"], {"action": "CREATE"})
+        await wait_until(lambda: received)
+        await service.disconnect()
+        return received
+
+    assert asyncio.run(scenario()) == [{"action": "CREATE"}]
+
+
+def test_debounced_store_keeps_known_changed_from_earlier_call(connections):
+    async def scenario():
+        service = SurrealDBService()
+        await service.connect()
+        stacks = [{"name": "web", "status": "running"}]
+        assert await service.store_unified_stacks(stacks)
+
+        # Mutated in place, then stored twice within one debounce window
+        stacks[0]["status"] = "exited"
+        writes = sum(len(c.queries) for c in connections)
+        results = await asyncio.gather(
+            service.store_unified_stacks(stacks, known_changed=True),
+            service.store_unified_stacks(stacks),
+        )
+        written = sum(len(c.queries) for c in connections) - writes
+        await service.disconnect()
+        return results, written
+
+    results, written = asyncio.run(scenario())
+    assert results == [True, True]
+    assert written == 1
+
+
+def test_pool_discards_connection_cancelled_by_socket_drop(connections):
+    async def scenario():
+        pool = surreal_module.SurrealPool(min_size=1, max_size=1)
+
+        async def open_connection():
+            db = surreal_module.AsyncSurreal("ws://fake")
+            await db.connect()
+            return db
+
+        await pool.open(open_connection)
+        dropped = connections[0]
+
+        async def borrow():
+            async with pool.acquire() as db:
+                await asyncio.Event().wait()
+
+        task = asyncio.create_task(borrow())
+        await asyncio.sleep(0.01)
+        # The SDK cancels the in-flight call once its receive loop ends
+        dropped.drop()
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        async with pool.acquire() as db:
+            replacement = db
+        await pool.close()
+        return dropped, replacement
+
+    dropped, replacement = asyncio.run(scenario())
+    assert replacement is not dropped
+    assert dropped.recv_task is None
+
+
+def test_pool_requeues_connection_after_caller_cancellation(connections):
+    async def scenario():
+        pool = surreal_module.SurrealPool(min_size=1, max_size=1)
+
+        async def open_connection():
+            db = surreal_module.AsyncSurreal("ws://fake")
+            await db.connect()
+            return db
+
+        await pool.open(open_connection)
+
+        async def borrow():
+            async with pool.acquire() as db:
+                await asyncio.Event().wait()
+
+        task = asyncio.create_task(borrow())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        async with pool.acquire() as db:
+            reused = db
+        await pool.close()
+        return reused
+
+    assert asyncio.run(scenario()) is connections[0]
+
+
+def test_unkeyable_stacks_are_skipped_instead_of_failing_the_write(connections):
+    async def scenario():
+        service = SurrealDBService()
+        await service.connect()
+        stacks = [
+            {"name": "web", "status": "running"},
+            {"status": "running"},
+            {"name": "web", "status": "exited"},
+            {"name": "db", "status": "running"},
+        ]
+        stored = await service.store_unified_stacks(stacks)
+        writes = [vars for c in connections for _, vars in c.queries if vars and "stacks" in vars]
+        digested = set(service._stack_digests)
+        await service.disconnect()
+        return stored, writes, digested
+
+    stored, writes, digested = asyncio.run(scenario())
+    assert stored
+    assert writes[-1]["stacks"] == [
+        {"name": "web", "status": "running"},
+        {"name": "db", "status": "running"},
+    ]
+    assert digested == {"web", "db"}